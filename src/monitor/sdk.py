@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
 import threading
+import time
 from dataclasses import dataclass
 from typing import Callable, Dict, Iterable, Mapping, Optional
 
@@ -37,6 +40,10 @@ class SerialPort:
             raise RuntimeError("SerialPort is closed")
         return self._reader.read_line(timeout=timeout)
 
+    def add_data_callback(self, callback: Callable[[SerialLine], None]):
+        """Call `callback(line)` from the reader thread for every parsed line."""
+        self._reader.add_data_callback(callback)
+
     def close(self):
         if not self._closed:
             self._reader.close()
@@ -89,37 +96,111 @@ def _normalize_port_configs(port_configs: Mapping[str, object]) -> Dict[str, Por
     return normalized
 
 
+# Lines serve() takes from one port before moving on to the next
+_MAX_LINES_PER_PASS = 64
+
+
+@contextlib.contextmanager
+def _profile_if_requested():
+    """Profile the enclosed block when OKIMOTUS_MONITOR_PROFILE names an output file."""
+    path = (os.environ.get("OKIMOTUS_MONITOR_PROFILE") or "").strip()
+    if not path:
+        yield
+        return
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+
 def serve(
     port_configs: Mapping[str, object],
     handler: Callable[[str, SerialLine], None],
     *,
     poll_interval: float = 0.05,
     stop_event: Optional[threading.Event] = None,
+    tick: Optional[Callable[[], Optional[float]]] = None,
 ):
     normalized = _normalize_port_configs(port_configs)
 
     loop_stop = stop_event or threading.Event()
-    remove_quit_callback = on_quit(loop_stop.set)
+    # Reader threads and stop requests both signal `wakeup`, so an idle loop
+    # wakes as soon as either happens instead of sleeping out its timeout.
+    # `pending` is checked before locking, so a steady stream of lines only
+    # takes the lock once per pass rather than once per line.
+    wakeup = threading.Condition()
+    pending = False
+
+    def _wake(*_args):
+        nonlocal pending
+        if not pending:
+            with wakeup:
+                pending = True
+                wakeup.notify()
+
+    def _request_stop():
+        loop_stop.set()
+        _wake()
+
+    remove_quit_callback = on_quit(_request_stop)
 
     ports = {
         name: get_port(config.device, config.baudrate, **(config.serial_kwargs or {}))
         for name, config in normalized.items()
     }
+    for port in ports.values():
+        port.add_data_callback(_wake)
 
+    # Resolve each port's bound readline once so the polling pass is a flat walk.
+    readers = tuple((name, port.readline) for name, port in ports.items())
     sleep_interval = max(0.0, poll_interval)
+    # While idle, back off towards max_idle_wait; new data still wakes the
+    # loop immediately, so this only trims empty wakeups. A caller-owned
+    # stop_event can be set without signalling us, so in that case keep
+    # waits at poll_interval to bound how long a stop goes unnoticed.
+    max_idle_wait = sleep_interval if stop_event is not None else max(sleep_interval, 0.5)
+    idle_wait = sleep_interval
 
     try:
-        while not loop_stop.is_set():
-            did_work = False
-            for name, port in ports.items():
-                line = port.readline(timeout=0)
-                if line is not None:
-                    did_work = True
-                    handler(name, line)
-            if loop_stop.is_set():
-                break
-            if not did_work and sleep_interval:
-                loop_stop.wait(sleep_interval)
+        # Inspect with: python -m pstats <file>
+        with _profile_if_requested():
+            while not loop_stop.is_set():
+                with wakeup:
+                    pending = False
+                did_work = False
+                for name, readline in readers:
+                    # Take up to a batch per port so a burst is handled in few
+                    # passes, without one busy port starving the others or tick().
+                    for _ in range(_MAX_LINES_PER_PASS):
+                        line = readline(timeout=0)
+                        if line is None:
+                            break
+                        did_work = True
+                        handler(name, line)
+                        if loop_stop.is_set():
+                            break
+                # tick() may return how soon it wants to run again, e.g. when a
+                # render is throttled; never sleep past that.
+                tick_due = None
+                if tick is not None:
+                    try:
+                        tick_due = tick()
+                    except StopIteration:
+                        loop_stop.set()
+                if loop_stop.is_set():
+                    break
+                if did_work:
+                    idle_wait = sleep_interval
+                elif sleep_interval:
+                    with wakeup:
+                        if not pending and not loop_stop.is_set():
+                            wakeup.wait(idle_wait if tick_due is None else min(idle_wait, tick_due))
+                    idle_wait = min(idle_wait * 2, max_idle_wait)
     except KeyboardInterrupt:
         loop_stop.set()
     finally:
@@ -137,6 +218,7 @@ def run(
     *,
     poll_interval: float = 0.05,
     initial_output: Optional[Iterable[Mapping[str, object]]] = None,
+    max_refresh_hz: float = 25.0,
 ):
     """
     High-level helper that manages the serial loop and dashboard updates.
@@ -150,11 +232,16 @@ def run(
             skips UI updates. Raise StopIteration to request a graceful exit.
         poll_interval: Maximum time to wait for new data per port read call.
         initial_output: Optional rows rendered before any serial data arrives.
+        max_refresh_hz: Upper bound on how often render is called. Lines that
+            arrive between two renders only update the snapshot, so the latest
+            value per alias wins. Pass 0 to render on every polling pass.
     """
 
     normalized = _normalize_port_configs(port_configs)
     latest: Dict[str, Optional[SerialLine]] = {name: None for name in normalized}
-    loop_stop = threading.Event()
+    min_render_interval = 1.0 / max_refresh_hz if max_refresh_hz > 0 else 0.0
+    dirty = False
+    last_render = 0.0
 
     if initial_output is not None:
         out(initial_output)
@@ -163,17 +250,28 @@ def run(
         return {name: (line.copy() if line is not None else None) for name, line in latest.items()}
 
     def handler(name: str, line: SerialLine):
+        nonlocal dirty
         latest[name] = line
-        snapshot = _snapshot()
-        try:
-            rows = render(snapshot)
-        except StopIteration:
-            loop_stop.set()
-            return
+        dirty = True
+
+    def tick() -> Optional[float]:
+        nonlocal dirty, last_render
+        if not dirty:
+            return None
+        now = time.monotonic()
+        remaining = last_render + min_render_interval - now
+        if remaining > 0:
+            # Throttled: have serve() call back once the interval has passed.
+            return remaining
+        dirty = False
+        last_render = now
+        # A StopIteration from render propagates and serve() stops the loop.
+        rows = render(_snapshot())
         if rows is not None:
             out(rows)
+        return None
 
-    return serve(normalized, handler, poll_interval=poll_interval, stop_event=loop_stop)
+    return serve(normalized, handler, poll_interval=poll_interval, tick=tick)
 
 
 __all__ = ["SerialPort", "PortConfig", "get_port", "run", "serve"]
@@ -1,18 +1,53 @@
 #!/usr/bin/env python3
 
+import collections
+import functools
 import logging
 import threading
 import time
-from queue import Empty, Full, Queue
-from typing import List, Dict, Any, Optional, Callable, Iterator, Mapping
+from typing import List, Dict, Any, Optional, Callable, Deque, Iterator, Mapping, Tuple
 
 import serial
 from serial.tools.list_ports import comports
 
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on a blocking read; keeps stop_reading() prompt without polling
+_READ_TIMEOUT = 0.1
+
+
+class _ThrottledErrorLog:
+    """
+    Log an error at most once per interval, counting the ones dropped in between.
+
+    Used for data-callback failures: a broken callback raises on every line,
+    which would otherwise flood the log at the serial line rate.
+    """
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self._next_log = 0.0
+        self._suppressed = 0
+
+    def __call__(self, msg: str, *args: Any):
+        now = time.monotonic()
+        if now < self._next_log:
+            self._suppressed += 1
+            return
+        if self._suppressed:
+            msg += " (%d earlier errors suppressed)"
+            args += (self._suppressed,)
+            self._suppressed = 0
+        self._next_log = now + self.interval
+        logger.error(msg, *args)
+
+
 class SerialLine(Mapping[int, str]):
     """Represents a parsed line along with raw text and metadata."""
 
+    __slots__ = ("values", "raw", "timestamp", "line_number")
+
     def __init__(self, values: Dict[int, str], raw: str, timestamp: float, line_number: int):
         self.values = values
         self.raw = raw
@@ -55,10 +90,7 @@ class SerialDataParser:
             return {}
         
         values = line.split(self.delimiter)
-        parsed_data = {}
-        
-        for position, value in enumerate(values):
-            parsed_data[position] = value.strip()
+        parsed_data = {position: value.strip() for position, value in enumerate(values)}
         
         # Update last known values
         self.last_values.update(parsed_data)
@@ -87,9 +119,12 @@ class SerialReader:
         # Data callbacks
         self._data_callbacks: List[Callable[[SerialLine], None]] = []
         self._error_callbacks: List[Callable[[Exception], None]] = []
+        self._log_callback_error = _ThrottledErrorLog()
 
-        # Queue for consumer-facing reads
-        self._data_queue: "Queue[SerialLine]" = Queue(maxsize=max(1, queue_size))
+        # Queue for consumer-facing reads; when full, appending drops the oldest line
+        self._data_queue: Deque[SerialLine] = collections.deque(maxlen=max(1, queue_size))
+        self._data_ready = threading.Condition()
+        self._waiters = 0
         
         # Statistics
         self.lines_received = 0
@@ -110,12 +145,12 @@ class SerialReader:
             self.serial_connection = serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
-                timeout=1,
+                timeout=_READ_TIMEOUT,
                 **self.serial_kwargs
             )
-            logging.info(f"Connected to {self.port} at {self.baudrate} baud")
+            logger.info("Connected to %s at %s baud", self.port, self.baudrate)
         except serial.SerialException as e:
-            logging.error(f"Failed to connect to {self.port}: {e}")
+            logger.error("Failed to connect to %s: %s", self.port, e)
             self._notify_error(e)
             raise
     
@@ -123,12 +158,12 @@ class SerialReader:
         """Disconnect from serial port"""
         if self.serial_connection and self.serial_connection.is_open:
             self.serial_connection.close()
-            logging.info(f"Disconnected from {self.port}")
+            logger.info("Disconnected from %s", self.port)
     
     def start_reading(self):
         """Start background reading thread"""
         if self._running:
-            logging.warning("Reader already running")
+            logger.warning("Reader already running")
             return
         
         if not self.serial_connection or not self.serial_connection.is_open:
@@ -137,7 +172,7 @@ class SerialReader:
         self._running = True
         self._reader_thread = threading.Thread(target=self._read_loop, daemon=True)
         self._reader_thread.start()
-        logging.info("Started serial reading thread")
+        logger.info("Started serial reading thread")
     
     def stop_reading(self):
         """Stop background reading thread"""
@@ -149,7 +184,7 @@ class SerialReader:
             self._reader_thread.join(timeout=2)
 
         self.disconnect()
-        logging.info("Stopped serial reading thread")
+        logger.info("Stopped serial reading thread")
 
     def close(self):
         """Public alias for stop_reading to match file-like semantics."""
@@ -163,45 +198,66 @@ class SerialReader:
         """Blocking read that returns the next parsed line or None on timeout."""
         if not self._running:
             self.start_reading()
-        try:
-            return self._data_queue.get(timeout=timeout)
-        except Empty:
-            return None
+        if not timeout:
+            # Non-blocking poll: deque.popleft is atomic, so skip the lock
+            try:
+                return self._data_queue.popleft()
+            except IndexError:
+                if timeout is not None:
+                    return None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._data_ready:
+            # Registered before the queue is checked, so a producer that
+            # appends after the check is guaranteed to see us and notify
+            self._waiters += 1
+            try:
+                while True:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if not self._data_ready.wait_for(lambda: self._data_queue, remaining):
+                        return None
+                    try:
+                        return self._data_queue.popleft()
+                    except IndexError:
+                        # A lock-free poller took the line after the check; wait again
+                        continue
+            finally:
+                self._waiters -= 1
     
     def _read_loop(self):
         """Main reading loop (runs in background thread)"""
-        buffer = ""
+        buffer = bytearray()
+        process_line = self._process_line
         
         while self._running:
             try:
-                if not self.serial_connection or not self.serial_connection.is_open:
+                conn = self.serial_connection
+                if not conn or not conn.is_open:
                     time.sleep(0.1)
                     continue
                 
-                # Read available data
-                if self.serial_connection.in_waiting > 0:
-                    data = self.serial_connection.read(self.serial_connection.in_waiting)
-                    if data:
-                        try:
-                            decoded = data.decode('utf-8', errors='replace')
-                            buffer += decoded
-                        except UnicodeDecodeError:
-                            logging.warning("Failed to decode serial data")
-                            continue
-                
-                # Process complete lines
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    self._process_line(line)
+                # Block until data arrives (bounded by the port timeout), then
+                # take everything that is already waiting in one read
+                data = conn.read(conn.in_waiting or 1)
+                if not data:
+                    continue
+                buffer += data
                 
-                time.sleep(0.01)  # Small delay to prevent CPU spinning
+                # Process complete lines; the carried-over tail never holds a
+                # newline, so only new data needs checking. Splitting the whole
+                # chunk once avoids re-copying the remainder per line, and
+                # decoding whole lines keeps multi-byte characters intact.
+                if b'\n' in data:
+                    lines = buffer.split(b'\n')
+                    buffer = lines.pop()
+                    for line in lines:
+                        process_line(line.decode('utf-8', errors='replace'))
                 
             except serial.SerialException as e:
-                logging.error(f"Serial error: {e}")
+                logger.error("Serial error: %s", e)
                 self._notify_error(e)
                 break
             except Exception as e:
-                logging.error(f"Unexpected error in read loop: {e}")
+                logger.error("Unexpected error in read loop: %s", e)
                 self._notify_error(e)
                 break
     
@@ -222,26 +278,21 @@ class SerialReader:
                 )
                 self._notify_data(payload)
         except Exception as e:
-            logging.warning(f"Failed to parse line '{line}': {e}")
+            logger.warning("Failed to parse line '%s': %s", line, e)
     
     def _notify_data(self, data: SerialLine):
         """Notify all data callbacks"""
+        # Queue first so callbacks that wake a reader find the line available.
+        # deque.append is atomic; only take the lock when a reader is waiting.
+        self._data_queue.append(data.copy())
+        if self._waiters:
+            with self._data_ready:
+                self._data_ready.notify()
         for callback in self._data_callbacks:
             try:
                 callback(data)
             except Exception as e:
-                logging.error(f"Error in data callback: {e}")
-        try:
-            self._data_queue.put_nowait(data.copy())
-        except Full:
-            try:
-                _ = self._data_queue.get_nowait()
-            except Empty:
-                pass
-            try:
-                self._data_queue.put_nowait(data.copy())
-            except Full:
-                pass
+                self._log_callback_error("Error in data callback: %s", e)
     
     def _notify_error(self, error: Exception):
         """Notify all error callbacks"""
@@ -249,10 +300,15 @@ class SerialReader:
             try:
                 callback(error)
             except Exception as e:
-                logging.error(f"Error in error callback: {e}")
+                logger.error("Error in error callback: %s", e)
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get reader statistics"""
+    def get_stats(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Get reader statistics; pass `now` to share one clock reading across readers"""
+        last_line_time = self.last_line_time
+        if last_line_time > 0:
+            time_since_last_line = (time.time() if now is None else now) - last_line_time
+        else:
+            time_since_last_line = None
         return {
             'port': self.port,
             'baudrate': self.baudrate,
@@ -260,15 +316,31 @@ class SerialReader:
             'running': self._running,
             'lines_received': self.lines_received,
             'lines_parsed': self.lines_parsed,
-            'last_line_time': self.last_line_time,
-            'time_since_last_line': time.time() - self.last_line_time if self.last_line_time > 0 else None
+            'last_line_time': last_line_time,
+            'time_since_last_line': time_since_last_line
         }
 
 
-def list_serial_ports() -> List[tuple]:
-    """List available serial ports, filtering out generic/unknown ports"""
+# (monotonic timestamp, ports) from the last enumeration, see list_serial_ports()
+_ports_cache: Optional[Tuple[float, List[tuple]]] = None
+
+
+def list_serial_ports(max_age: float = 0.0) -> List[tuple]:
+    """
+    List available serial ports, filtering out generic/unknown ports.
+
+    Every call rescans by default so hot-plugged adapters show up. Callers
+    that poll repeatedly, such as a port picker, can pass `max_age` to reuse
+    a scan that is at most that many seconds old.
+    """
+    global _ports_cache
+    now = time.monotonic()
+    if _ports_cache is not None and now - _ports_cache[0] < max_age:
+        return list(_ports_cache[1])
+
+    available = sorted(comports())
     ports = []
-    for port, desc, hwid in sorted(comports()):
+    for port, desc, hwid in available:
         # Filter out ports with meaningless descriptions
         if desc and desc.lower() not in ['n/a', 'unknown', '']:
             ports.append((port, desc, hwid))
@@ -280,10 +352,11 @@ def list_serial_ports() -> List[tuple]:
     # If no meaningful ports found, fall back to showing all ports
     # (in case user has unusual setup)
     if not ports:
-        for port, desc, hwid in sorted(comports()):
+        for port, desc, hwid in available:
             ports.append((port, desc or 'Unknown', hwid))
     
-    return ports
+    _ports_cache = (now, ports)
+    return list(ports)
 
 
 class MultiPortSerialReader:
@@ -308,11 +381,12 @@ class MultiPortSerialReader:
         # Callbacks
         self._data_callbacks: List[Callable[[str, SerialLine], None]] = []  # (port, data)
         self._error_callbacks: List[Callable[[str, Exception], None]] = []  # (port, error)
+        self._log_callback_error = _ThrottledErrorLog()
         
         # Setup callbacks for each reader
         for port, reader in self.readers.items():
-            reader.add_data_callback(lambda data, p=port: self._on_port_data(p, data))
-            reader.add_error_callback(lambda error, p=port: self._on_port_error(p, error))
+            reader.add_data_callback(functools.partial(self._on_port_data, port))
+            reader.add_error_callback(functools.partial(self._on_port_error, port))
     
     def add_data_callback(self, callback: Callable[[str, Dict[int, str]], None]):
         """Add callback for new data. Signature: callback(port, data)"""
@@ -328,7 +402,7 @@ class MultiPortSerialReader:
             try:
                 callback(port, data)
             except Exception as e:
-                logging.error(f"Error in data callback for port {port}: {e}")
+                self._log_callback_error("Error in data callback for port %s: %s", port, e)
     
     def _on_port_error(self, port: str, error: Exception):
         """Handle error from a specific port"""
@@ -336,16 +410,16 @@ class MultiPortSerialReader:
             try:
                 callback(port, error)
             except Exception as e:
-                logging.error(f"Error in error callback for port {port}: {e}")
+                logger.error("Error in error callback for port %s: %s", port, e)
     
     def start_reading(self):
         """Start reading from all ports"""
         for port, reader in self.readers.items():
             try:
                 reader.start_reading()
-                logging.info(f"Started reading from {port}")
+                logger.info("Started reading from %s", port)
             except Exception as e:
-                logging.error(f"Failed to start reading from {port}: {e}")
+                logger.error("Failed to start reading from %s: %s", port, e)
                 self._on_port_error(port, e)
     
     def stop_reading(self):
@@ -353,16 +427,14 @@ class MultiPortSerialReader:
         for port, reader in self.readers.items():
             try:
                 reader.stop_reading()
-                logging.info(f"Stopped reading from {port}")
+                logger.info("Stopped reading from %s", port)
             except Exception as e:
-                logging.error(f"Error stopping {port}: {e}")
+                logger.error("Error stopping %s: %s", port, e)
     
     def get_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics for all ports"""
-        stats = {}
-        for port, reader in self.readers.items():
-            stats[port] = reader.get_stats()
-        return stats
+        now = time.time()
+        return {port: reader.get_stats(now) for port, reader in self.readers.items()}
     
     def get_reader(self, port: str) -> Optional[SerialReader]:
         """Get the SerialReader for a specific port"""
@@ -10,19 +10,21 @@ when `textual` is not installed or when callers provide a custom renderer via
 from __future__ import annotations
 
 import atexit
+import collections
 import contextlib
 import curses
+import functools
 import os
-import queue
 import signal
 import sys
 import threading
 import time
-from typing import Callable, Iterable, Iterator, List, Mapping, Optional
+from typing import Callable, Deque, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 try:  # textual is optional and only used when available
     from textual.app import App, ComposeResult
     from textual.widgets import DataTable, Footer, Header, Static
+    from textual.widgets.data_table import ColumnKey, RowKey
 
     _TEXTUAL_AVAILABLE = True
 except Exception:  # pragma: no cover - textual might not be installed
@@ -36,6 +38,27 @@ DisplayItems = List[Mapping[str, object]]
 Renderer = Callable[[object, DisplayItems], None]
 HeadlessRenderer = Callable[[DisplayItems], None]
 
+# Curses colour pairs: 1 = title bar, 2/3 = alternating rows.
+_COLOR_PAIRS = (
+    (1, curses.COLOR_CYAN),
+    (2, curses.COLOR_WHITE),
+    (3, curses.COLOR_YELLOW),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _clock_text(second: int) -> str:
+    """Format an epoch second as local HH:MM:SS (repeat calls hit the cache)."""
+    lt = time.localtime(second)
+    return f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+
+
+@functools.lru_cache(maxsize=4)
+def _header_text(width: int) -> str:
+    """Centered curses title bar, rebuilt only when the terminal width changes."""
+    title = " Okimotus Monitor "
+    return f"{title:-^{width}}"[:width]
+
 
 @contextlib.contextmanager
 def _suppress_signal_errors() -> Iterator[None]:
@@ -64,8 +87,10 @@ class _DisplayManager:
     def __init__(self, refresh_interval: float = 0.2):
         self.refresh_interval = max(0.05, refresh_interval)
         self._items: List[Mapping[str, object]] = []
+        self._version = 0
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
+        self._wake = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._headless = not sys.stdout.isatty()
         self._quit_callbacks: List[Callable[[], None]] = []
@@ -73,8 +98,11 @@ class _DisplayManager:
         self._headless_renderer: Optional[HeadlessRenderer] = None
         textual_flag = (os.environ.get("OKIMOTUS_MONITOR_TEXTUAL") or "").strip().lower()
         self._textual_disabled = textual_flag in {"0", "false", "no", "off"}
-        self._textual_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        # Only the newest snapshot matters to the dashboard, so a one-slot deque
+        # lets producers overwrite it without locking or unbounded growth.
+        self._textual_queue: Deque[DisplayItems] = collections.deque(maxlen=1)
         self._textual_app: Optional["_MonitorDashboardApp"] = None
+        self._use_textual = self._resolve_textual()
 
     def start(self):
         if self._headless:
@@ -88,6 +116,8 @@ class _DisplayManager:
 
     def stop(self):
         self._stop_event.set()
+        # Wake the curses loop so join() doesn't sit out its refresh interval.
+        self._wake.set()
         app = self._textual_app
         if app is not None:
             try:
@@ -100,19 +130,29 @@ class _DisplayManager:
         self._thread = None
 
     def update(self, items: Iterable[Mapping[str, object]]):
-        snapshot = list(items)
+        # Copy each row: callers may reuse and mutate their dicts in place, and
+        # the change check below must not compare those objects with themselves.
+        snapshot = [dict(entry) for entry in items]
         with self._lock:
-            self._items = snapshot
+            changed = snapshot != self._items
+            if changed:
+                self._items = snapshot
+                self._version += 1
         if self._headless:
             self._print_headless()
             return
         if self._should_use_textual():
-            self._textual_queue.put(snapshot)
+            self._textual_queue.append(snapshot)
+        elif changed:
+            self._wake.set()
         self.start()
 
     def set_renderer(self, renderer: Optional[Renderer]):
         with self._lock:
+            if renderer is self._renderer:
+                return
             self._renderer = renderer
+            self._use_textual = self._resolve_textual()
         # Restart the UI so the change takes effect.
         self.stop()
 
@@ -157,13 +197,16 @@ class _DisplayManager:
             return list(self._items)
 
     def _should_use_textual(self) -> bool:
+        return self._use_textual
+
+    def _resolve_textual(self) -> bool:
+        # Only changes when the renderer does, so callers hold the lock (or run
+        # from __init__) and cache the answer instead of re-deciding per update.
         if not _TEXTUAL_AVAILABLE:
             return False
         if self._textual_disabled:
             return False
-        with self._lock:
-            has_custom_renderer = self._renderer is not None
-        return not has_custom_renderer
+        return self._renderer is None
 
     def _run_textual(self):
         if not _TEXTUAL_AVAILABLE:
@@ -198,27 +241,39 @@ class _DisplayManager:
 
         curses.start_color()
         curses.use_default_colors()
-        curses.init_pair(1, curses.COLOR_CYAN, -1)
-        curses.init_pair(2, curses.COLOR_WHITE, -1)
-        curses.init_pair(3, curses.COLOR_YELLOW, -1)
+        for pair, foreground in _COLOR_PAIRS:
+            curses.init_pair(pair, foreground, -1)
 
+        drawn_version = -1
         while not self._stop_event.is_set():
-            items = self._snapshot()
-            self._render(stdscr, items)
+            # update() replaces _items rather than mutating it, so no copy is needed.
+            with self._lock:
+                version = self._version
+                items = self._items
+                renderer = self._renderer
+            # The built-in view only depends on the items, so skip redraws until
+            # monitor.out() delivers a new batch. Custom renderers may animate.
+            if renderer is not None or version != drawn_version:
+                self._render(stdscr, items, renderer)
+                drawn_version = version
             ch = stdscr.getch()
-            if ch in (ord('q'), ord('Q')):
+            if ch == curses.KEY_RESIZE:
+                drawn_version = -1
+            elif ch in (ord('q'), ord('Q')):
                 self._stop_event.set()
                 self._emit_quit()
                 break
-            time.sleep(self.refresh_interval)
+            # Sleep until the next batch arrives; the timeout keeps keys responsive.
+            self._wake.wait(self.refresh_interval)
+            self._wake.clear()
         self._stop_event.set()
 
-    def _render(self, stdscr, items: List[Mapping[str, object]]):
-        renderer = None
-        with self._lock:
-            renderer = self._renderer
+    def _render(self, stdscr, items: List[Mapping[str, object]], renderer: Optional[Renderer]):
         if renderer is None:
             renderer = self._default_renderer
+        else:
+            # items is the manager's own list; custom renderers get a copy they may reorder.
+            items = list(items)
         try:
             renderer(stdscr, items)
         except Exception:
@@ -230,27 +285,24 @@ class _DisplayManager:
         height, width = stdscr.getmaxyx()
         max_width = max(1, width - 1)
 
-        title = " Okimotus Monitor "
-        header = f"{title:-^{max_width}}"
-        stdscr.addnstr(0, 0, header[:max_width], max_width, curses.color_pair(1) | curses.A_BOLD)
+        stdscr.addnstr(0, 0, _header_text(max_width), max_width, curses.color_pair(1) | curses.A_BOLD)
 
         if not items:
             stdscr.addnstr(2, 0, "Waiting for monitor.out(...) updates...", max_width, curses.color_pair(3))
         else:
-            row = 2
-            label_width = min(32, max(16, max((len(str(e.get('label', ''))) for e in items), default=16)))
-            for idx, entry in enumerate(items):
-                label = str(entry.get('label', '')).replace('\x00', ' ').strip() or 'observable'
-                value = entry.get('value', '')
-                unit = entry.get('unit', '')
-                value_str = str(value).replace('\x00', ' ')
+            # Rows 2 .. height-2 are drawable; don't format or measure the rest.
+            visible = items[:max(0, height - 3)]
+            labels = [str(e.get('label', '')).replace('\x00', ' ').strip() or 'observable' for e in visible]
+            label_width = min(32, max(16, max(map(len, labels), default=16)))
+            row_colors = (curses.color_pair(2), curses.color_pair(3))
+            addnstr = stdscr.addnstr
+            for idx, (label, entry) in enumerate(zip(labels, visible)):
+                get = entry.get
+                value_str = str(get('value', '')).replace('\x00', ' ')
+                unit = get('unit', '')
                 unit_str = f" {unit}" if unit else ""
                 line = f"{label:<{label_width}} {value_str}{unit_str}".replace('\x00', ' ')
-                if row >= height - 1:
-                    break
-                color = curses.color_pair(2 if idx % 2 == 0 else 3)
-                stdscr.addnstr(row, 0, line.ljust(max_width), max_width, color)
-                row += 1
+                addnstr(idx + 2, 0, line.ljust(max_width), max_width, row_colors[idx & 1])
         stdscr.refresh()
 
 
@@ -279,10 +331,6 @@ if _TEXTUAL_AVAILABLE:
             border: round #09c;
             padding: 1;
         }
-
-        .hidden {
-            display: none;
-        }
         """
 
         BINDINGS = [
@@ -292,6 +340,14 @@ if _TEXTUAL_AVAILABLE:
             ("?", "toggle_help", "Help"),
         ]
 
+        # Status line prefix keyed by (paused, sort_alpha).
+        _STATUS_PREFIXES = {
+            (False, False): "LIVE | Sort: Monitor order",
+            (False, True): "LIVE | Sort: A→Z",
+            (True, False): "PAUSED | Sort: Monitor order",
+            (True, True): "PAUSED | Sort: A→Z",
+        }
+
         def __init__(self, manager: _DisplayManager):
             super().__init__()
             self._manager = manager
@@ -300,8 +356,12 @@ if _TEXTUAL_AVAILABLE:
             self._latest: DisplayItems = []
             self._last_update: float = 0.0
             self._status_widget: Optional[Static] = None
+            self._status_text = ""
             self._help_widget: Optional[Static] = None
             self._table: Optional[DataTable] = None
+            self._column_keys: List[ColumnKey] = []
+            self._row_keys: List[RowKey] = []
+            self._rendered: List[Tuple[str, str, str]] = []
 
         def compose(self) -> ComposeResult:
             yield Header(show_clock=True)
@@ -329,53 +389,77 @@ if _TEXTUAL_AVAILABLE:
         def on_mount(self):
             if self._table is None:
                 return
-            self._table.add_columns("Label", "Value", "Unit")
+            self._column_keys = self._table.add_columns("Label", "Value", "Unit")
             self._table.focus()
             self.set_interval(0.1, self._pull_updates)
             self._refresh_status()
 
         def _pull_updates(self):
-            changed = False
-            while True:
-                try:
-                    rows = self._manager._textual_queue.get_nowait()
-                except queue.Empty:
-                    break
-                else:
-                    self._latest = list(rows)
-                    self._last_update = time.time()
-                    changed = True
-            if changed and not self._paused:
+            try:
+                rows = self._manager._textual_queue.popleft()
+            except IndexError:
+                return
+            self._last_update = time.time()
+            self._latest = rows
+            if not self._paused:
                 self._render_items()
-            elif changed:
-                self._refresh_status()
+                return
+            self._refresh_status()
 
         def _render_items(self):
             if self._table is None:
                 return
-            self._table.clear()
-            for entry in self._sorted_items():
-                label = str(entry.get("label", "")).replace("\x00", " ").strip() or "observable"
-                value = str(entry.get("value", "")).replace("\x00", " ")
-                unit = str(entry.get("unit", "") or "").replace("\x00", " ")
-                self._table.add_row(label, value, unit)
-            self._refresh_status()
+            rows = [self._row_cells(entry) for entry in self._sorted_items()]
+            # Each table mutation would otherwise schedule its own refresh;
+            # batch_update collapses them into one repaint.
+            with self.batch_update():
+                table = self._table
+                row_keys = self._row_keys
+                # Rows present before and after: only touch the cells that changed.
+                for row_key, before, after in zip(row_keys, self._rendered, rows):
+                    if before == after:
+                        continue
+                    for column_key, old, new in zip(self._column_keys, before, after):
+                        if old != new:
+                            table.update_cell(row_key, column_key, new, update_width=True)
+                # Then append or drop the tail instead of rebuilding the table.
+                if len(rows) > len(row_keys):
+                    row_keys.extend(table.add_rows(rows[len(row_keys):]))
+                elif not rows:
+                    table.clear()
+                    row_keys.clear()
+                elif len(rows) < len(row_keys):
+                    for row_key in row_keys[len(rows):]:
+                        table.remove_row(row_key)
+                    del row_keys[len(rows):]
+                self._rendered = rows
+                self._refresh_status()
+
+        @staticmethod
+        def _row_cells(entry: Mapping[str, object]) -> Tuple[str, str, str]:
+            label = str(entry.get("label", "")).replace("\x00", " ").strip() or "observable"
+            value = str(entry.get("value", "")).replace("\x00", " ")
+            unit = str(entry.get("unit", "") or "").replace("\x00", " ")
+            return label, value, unit
 
         def _sorted_items(self) -> DisplayItems:
             if not self._sort_alpha:
-                return list(self._latest)
+                # Callers only iterate, and _latest is replaced rather than mutated.
+                return self._latest
             return sorted(self._latest, key=lambda row: str(row.get("label", "")).lower())
 
         def _refresh_status(self):
             if not self._status_widget:
                 return
-            parts = ["PAUSED" if self._paused else "LIVE"]
-            parts.append("Sort: A→Z" if self._sort_alpha else "Sort: Monitor order")
-            parts.append(f"Rows: {len(self._latest)}")
+            status = f"{self._STATUS_PREFIXES[self._paused, self._sort_alpha]} | Rows: {len(self._latest)}"
             if self._last_update:
-                age = max(0.0, time.time() - self._last_update)
-                parts.append(f"Updated {age:.1f}s ago")
-            self._status_widget.update(" | ".join(parts))
+                # The status line is only redrawn when rows arrive, so a relative
+                # age would always read ~0s; show the wall-clock time instead.
+                status = f"{status} | Updated {_clock_text(int(self._last_update))}"
+            # Static.update triggers a refresh, so skip it when nothing changed.
+            if status != self._status_text:
+                self._status_text = status
+                self._status_widget.update(status)
 
         def action_toggle_pause(self):
             self._paused = not self._paused
@@ -423,7 +507,7 @@ else:
 
 
 _display = _DisplayManager()
-atexit.register(lambda: _display.stop())
+atexit.register(_display.stop)
 
 
 def out(items: Iterable[Mapping[str, object]]):